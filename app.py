@@ -1,33 +1,121 @@
 from flask import Flask, render_template, request, jsonify, session
+from flask.json.provider import JSONProvider
+from flask_session import Session
+from flask_compress import Compress
+import redis
 import yfinance as yf
 import pandas as pd
 import numpy as np
+import orjson
+from numpy.lib.stride_tricks import sliding_window_view
 import json
 import uuid
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Tuple
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
-app = Flask(__name__)
+from cache import FileCache, MemoryCache, ttl_for_interval
+from indicators import rsi_sma_bb
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, serializing NumPy values natively"""
+    option = orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=self.option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Skip the bytes -> str -> bytes round trip of the default implementation
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.option), mimetype='application/json')
+
+
+class TradingFlask(Flask):
+    json_provider_class = OrjsonProvider
+
+
+app = TradingFlask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-here')
 
+# Keep session data in Redis so only the session id travels in the cookie
+app.config['SESSION_TYPE'] = 'redis'
+app.config['SESSION_REDIS'] = redis.from_url(os.environ.get('REDIS_URL', 'redis://localhost:6379/0'))
+Session(app)
+
+# Compress larger responses such as chart payloads; small JSON is not worth it
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
+
+# Quotes refresh with the watchlist, so they expire sooner than daily candles
+QUOTE_TTL = 30
+PROFILE_TTL = 86400
+# Failed name lookups are retried after this long, and each watchlist refresh queues at most a few
+PROFILE_RETRY_TTL = 900
+PROFILE_LOOKUPS_PER_REFRESH = 10
+# Longest /api/symbol waits for a name before answering with the bare symbol
+PROFILE_TIMEOUT = 5
+
+YAHOO_CHART_URL = 'https://query2.finance.yahoo.com/v8/finance/chart/{symbol}'
+YAHOO_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+# Shared keep-alive session so Yahoo calls reuse pooled TLS connections.
+# Rate-limited (429) responses are not retried, since retrying only deepens the
+# throttling, and Retry-After is ignored so a worker never sleeps for as long as Yahoo asks.
+http_session = requests.Session()
+http_session.headers.update(YAHOO_HEADERS)
+http_session.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(500, 502, 503, 504),
+        respect_retry_after_header=False
+    )
+))
+
+# yf.download keeps its results in module globals and is not re-entrant, so
+# concurrent watchlist refreshes must take turns. Ticker.history writes the same
+# globals, which is why single quotes come from the direct chart API instead.
+yf_download_lock = threading.Lock()
+
+INDIAN_EXCHANGE_SUFFIXES = ('.NS', '.BO')
+COMMON_US_SYMBOLS = frozenset({'AAPL', 'GOOGL', 'MSFT', 'TSLA', 'AMZN', 'NVDA', 'META', 'SPY'})
+
 class TradingPlatform:
     def __init__(self):
         self.popular_symbols = {
             'US': ['AAPL', 'GOOGL', 'MSFT', 'TSLA', 'AMZN', 'NVDA', 'META', 'SPY', 'QQQ', 'BTC-USD', 'ETH-USD'],
             'INDIAN': ['RELIANCE.NS', 'TCS.NS', 'HDFCBANK.NS', 'INFY.NS', 'HINDUNILVR.NS', 'ITC.NS', 'SBIN.NS', 'BHARTIARTL.NS', 'KOTAKBANK.NS', 'LT.NS']
         }
+        self.cache = FileCache(os.environ.get('CACHE_DIR', '.cache'))
+        # Serialized chart responses for hot symbols, so repeat hits skip unpickling and encoding
+        self.chart_cache = MemoryCache(maxsize=256)
+        # Runs blocking Yahoo lookups that should not hold up a request
+        self._pool = ThreadPoolExecutor(max_workers=16)
+        # Separate pool for profile lookups a request waits on, so background work cannot delay them
+        self._profile_pool = ThreadPoolExecutor(max_workers=4)
+        # Background name lookups in flight, and recent failures that should not be retried yet
+        self._pending_profiles = set()
+        self._pending_lock = threading.Lock()
+        self.failed_profiles = MemoryCache(maxsize=1024)
         
     def format_symbol_for_yahoo(self, symbol: str) -> str:
         """Format symbol for Yahoo Finance API"""
-        indian_exchanges = ['.NS', '.BO']
-        
-        if any(exchange in symbol for exchange in indian_exchanges):
+        if symbol.endswith(INDIAN_EXCHANGE_SUFFIXES):
             return symbol
             
-        common_us_symbols = ['AAPL', 'GOOGL', 'MSFT', 'TSLA', 'AMZN', 'NVDA', 'META', 'SPY']
-        if symbol.upper() in common_us_symbols:
+        if symbol.upper() in COMMON_US_SYMBOLS:
             return symbol
             
         if len(symbol) <= 10 and '.' not in symbol:
@@ -58,137 +146,322 @@ class TradingPlatform:
         return interval_map.get(timeframe, ('1d', '1y'))
 
     def calculate_rsi(self, prices: List[float], period: int = 14) -> List[float]:
-        """Calculate RSI indicator"""
+        """Calculate RSI indicator using Wilder's smoothing"""
         if len(prices) < period + 1:
             return [50.0] * len(prices)
             
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
+        deltas = np.diff(np.asarray(prices, dtype=np.float64))
+        gains = np.maximum(deltas, 0.0)
+        losses = np.maximum(-deltas, 0.0)
         
-        rsi_values = []
-        for i in range(len(prices)):
-            if i < period:
-                rsi_values.append(50.0)
-                continue
-                
-            avg_gain = np.mean(gains[max(0, i-period):i])
-            avg_loss = np.mean(losses[max(0, i-period):i])
-            
-            if avg_loss == 0:
-                rsi = 100.0
-            else:
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
-                
-            rsi_values.append(rsi)
+        # Running averages: seeded with a simple mean, then updated in O(1) per bar
+        avg_gains = np.empty(len(deltas) - period + 1)
+        avg_losses = np.empty(len(deltas) - period + 1)
+        avg_gain = gains[:period].mean()
+        avg_loss = losses[:period].mean()
+        avg_gains[0], avg_losses[0] = avg_gain, avg_loss
+        
+        for i in range(period, len(deltas)):
+            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+            avg_gains[i - period + 1] = avg_gain
+            avg_losses[i - period + 1] = avg_loss
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = np.where(avg_losses == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gains / avg_losses))
             
-        return rsi_values
+        return [50.0] * period + rsi.tolist()
+
+    def _rolling_mean(self, values: np.ndarray, period: int) -> np.ndarray:
+        """Mean of each full window via cumulative-sum differencing"""
+        cumsum = np.concatenate(([0.0], np.cumsum(values)))
+        return (cumsum[period:] - cumsum[:-period]) / period
 
     def calculate_sma(self, values: List[float], period: int) -> List[float]:
         """Calculate Simple Moving Average"""
-        sma = []
-        for i in range(len(values)):
-            if i < period - 1:
-                sma.append(values[i])
-            else:
-                avg = sum(values[i-period+1:i+1]) / period
-                sma.append(avg)
-        return sma
+        if len(values) < period:
+            return list(values)
+            
+        sma = self._rolling_mean(np.asarray(values, dtype=np.float64), period)
+        return list(values[:period - 1]) + sma.tolist()
 
     def calculate_bollinger_bands(self, values: List[float], period: int = 20, multiplier: float = 2.0) -> Tuple[List[float], List[float]]:
         """Calculate Bollinger Bands"""
-        sma = self.calculate_sma(values, period)
-        upper, lower = [], []
+        warmup = values[:period - 1]
+        upper = [v + 10 for v in warmup]
+        lower = [v - 10 for v in warmup]
         
-        for i in range(len(values)):
-            if i < period - 1:
-                upper.append(values[i] + 10)
-                lower.append(values[i] - 10)
-            else:
-                slice_values = values[i-period+1:i+1]
-                mean = sma[i]
-                variance = sum((x - mean) ** 2 for x in slice_values) / period
-                std_dev = variance ** 0.5
-                upper.append(mean + (multiplier * std_dev))
-                lower.append(mean - (multiplier * std_dev))
-                
+        if len(values) < period:
+            return upper, lower
+            
+        arr = np.asarray(values, dtype=np.float64)
+        mean = self._rolling_mean(arr, period)
+        windows = sliding_window_view(arr, period)
+        std_dev = np.sqrt(((windows - mean[:, None]) ** 2).mean(axis=1))
+        
+        upper += (mean + multiplier * std_dev).tolist()
+        lower += (mean - multiplier * std_dev).tolist()
         return upper, lower
 
-    def fetch_symbol_data(self, symbol: str) -> Optional[Dict]:
-        """Fetch current symbol data"""
+    def calculate_rsi_indicators(self, close: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Calculate RSI with its moving average and Bollinger Bands"""
+        if rsi_sma_bb is not None:
+            return rsi_sma_bb(close, 14, 9, 20, 2.0)
+            
+        rsi_values = self.calculate_rsi(close)
+        rsi_ma = self.calculate_sma(rsi_values, 9)
+        rsi_upper_bb, rsi_lower_bb = self.calculate_bollinger_bands(rsi_values, 20, 2)
+        return np.asarray(rsi_values), np.asarray(rsi_ma), np.asarray(rsi_upper_bb), np.asarray(rsi_lower_bb)
+
+    def get_chart_arrays(self, formatted_symbol: str, period: str, interval: str, ttl: Optional[int] = None) -> Optional[Dict[str, np.ndarray]]:
+        """Get OHLCV arrays straight from Yahoo's chart API, served from the disk cache while fresh"""
+        name = f"chart_{interval}_{period}"
+        arrays = self.cache.get(formatted_symbol, name, ttl if ttl is not None else ttl_for_interval(interval))
+        if arrays is None:
+            arrays = self.download_chart_arrays(formatted_symbol, period, interval)
+            if arrays is not None:
+                self.cache.set(formatted_symbol, name, arrays)
+        return arrays
+
+    def download_chart_arrays(self, formatted_symbol: str, period: str, interval: str) -> Optional[Dict[str, np.ndarray]]:
+        """Download OHLCV from Yahoo's chart API into NumPy arrays, bypassing pandas"""
+        response = http_session.get(
+            YAHOO_CHART_URL.format(symbol=formatted_symbol),
+            params={'interval': interval, 'range': period},
+            timeout=10
+        )
+        response.raise_for_status()
+        
+        results = response.json()['chart']['result']
+        if not results or not results[0].get('timestamp'):
+            return None
+        result = results[0]
+        
+        quote = result['indicators']['quote'][0]
+        # Columnar (struct-of-arrays) layout, one array per field; Yahoo's nulls become NaN
+        closes = np.asarray(quote['close'], dtype=np.float64)
+        valid = ~np.isnan(closes)
+        arrays = {
+            't': np.asarray(result['timestamp'], dtype=np.int64)[valid] * 1000,
+            'o': np.asarray(quote['open'], dtype=np.float64)[valid],
+            'h': np.asarray(quote['high'], dtype=np.float64)[valid],
+            'l': np.asarray(quote['low'], dtype=np.float64)[valid],
+            'c': closes[valid],
+            'v': np.nan_to_num(np.asarray(quote['volume'], dtype=np.float64)[valid]).astype(np.int64)
+        }
+        
+        # Match yfinance's auto_adjust: scale prices by the split/dividend-adjusted close
+        adjclose = result['indicators'].get('adjclose')
+        if adjclose:
+            ratio = np.asarray(adjclose[0]['adjclose'], dtype=np.float64)[valid] / arrays['c']
+            for key in ('o', 'h', 'l', 'c'):
+                arrays[key] = arrays[key] * ratio
+        
+        return arrays if len(arrays['t']) else None
+
+    def get_info(self, formatted_symbol: str) -> Dict:
+        """Get symbol profile info, served from the disk cache while fresh"""
+        info = self.cache.get(formatted_symbol, 'info', PROFILE_TTL)
+        if info is None:
+            info = yf.Ticker(formatted_symbol, session=http_session).info
+            if info:
+                self.cache.set(formatted_symbol, 'info', info)
+        return info
+
+    def build_quote(self, symbol: str, closes: np.ndarray) -> Dict:
+        """Build a quote from the last two daily closes"""
+        current_price = closes[-1]
+        previous_close = closes[-2] if len(closes) > 1 else current_price
+        change = current_price - previous_close
+        change_percent = (change / previous_close) * 100
+        
+        return {
+            'symbol': symbol.upper(),
+            'name': symbol,
+            'price': current_price,
+            'change': change,
+            'changePercent': change_percent
+        }
+
+    def fetch_quote(self, symbol: str) -> Optional[Dict]:
+        """Fetch the current quote from price history only"""
         try:
             formatted_symbol = self.format_symbol_for_yahoo(symbol)
-            ticker = yf.Ticker(formatted_symbol)
-            info = ticker.info
-            hist = ticker.history(period='2d')
+            # The direct chart API never touches yfinance's module globals, unlike Ticker.history
+            arrays = self.get_chart_arrays(formatted_symbol, period='2d', interval='1d', ttl=QUOTE_TTL)
             
-            if hist.empty:
+            if arrays is None:
                 return None
                 
-            current_price = hist['Close'].iloc[-1]
-            previous_close = hist['Close'].iloc[-2] if len(hist) > 1 else current_price
-            change = current_price - previous_close
-            change_percent = (change / previous_close) * 100
-            
-            return {
-                'symbol': symbol.upper(),
-                'name': info.get('longName', symbol),
-                'price': float(current_price),
-                'change': float(change),
-                'changePercent': float(change_percent)
-            }
+            return self.build_quote(symbol, arrays['c'])
         except Exception as e:
-            print(f"Error fetching data for {symbol}: {e}")
+            print(f"Error fetching quote for {symbol}: {e}")
             return None
 
-    def fetch_chart_data(self, symbol: str, timeframe: str) -> Optional[Dict]:
-        """Fetch chart data with candlesticks and RSI"""
+    def fetch_profile(self, symbol: str) -> Optional[Dict]:
+        """Fetch symbol profile details such as the company name"""
+        formatted_symbol = self.format_symbol_for_yahoo(symbol)
+        try:
+            info = self.get_info(formatted_symbol)
+        except Exception as e:
+            print(f"Error fetching profile for {symbol}: {e}")
+            info = None
+        if not info:
+            # Remember the failure so repeat requests skip the slow lookup for a while
+            self.failed_profiles.set(formatted_symbol, True, PROFILE_RETRY_TTL)
+            return None
+        return {'name': info.get('longName', symbol)}
+
+    def fetch_symbol_data(self, symbol: str) -> Optional[Dict]:
+        """Fetch current symbol data"""
+        # The profile lookup is slow when uncached, so overlap it with the quote
+        profile = None
+        if self.failed_profiles.get(self.format_symbol_for_yahoo(symbol)) is None:
+            profile = self._profile_pool.submit(self.fetch_profile, symbol)
+        data = self.fetch_quote(symbol)
+        if data and profile is not None:
+            try:
+                data.update(profile.result(timeout=PROFILE_TIMEOUT) or {})
+            except FutureTimeoutError:
+                # Keep the symbol as the name; the lookup still completes and fills the cache
+                pass
+        return data
+
+    def load_profile(self, formatted_symbol: str) -> None:
+        """Warm the profile cache for a symbol; run on the background pool"""
+        try:
+            self.fetch_profile(formatted_symbol)
+        finally:
+            with self._pending_lock:
+                self._pending_profiles.discard(formatted_symbol)
+
+    def queue_profile_lookups(self, formatted_symbols: List[str]) -> None:
+        """Queue background profile lookups, skipping ones in flight or recently failed"""
+        with self._pending_lock:
+            queued = [
+                formatted_symbol for formatted_symbol in dict.fromkeys(formatted_symbols)
+                if formatted_symbol not in self._pending_profiles
+                and self.failed_profiles.get(formatted_symbol) is None
+            ][:PROFILE_LOOKUPS_PER_REFRESH]
+            self._pending_profiles.update(queued)
+        for formatted_symbol in queued:
+            self._pool.submit(self.load_profile, formatted_symbol)
+
+    def download_quote_histories(self, formatted_symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        """Download recent daily history for many symbols in one batched request"""
+        with yf_download_lock:
+            df = yf.download(
+                tickers=formatted_symbols, period='2d', interval='1d', group_by='ticker',
+                auto_adjust=True, threads=True, progress=False
+            )
+        
+        histories = {}
+        for formatted_symbol in formatted_symbols:
+            if isinstance(df.columns, pd.MultiIndex):
+                # yfinance upper-cases tickers when it labels the columns
+                ticker = formatted_symbol.upper()
+                if ticker not in df.columns.get_level_values(0):
+                    continue
+                hist = df[ticker]
+            else:
+                hist = df
+            # Symbols trading on different calendars leave NaN rows in the combined frame
+            hist = hist.dropna(subset=['Close'])
+            if not hist.empty:
+                self.cache.set(formatted_symbol, '1d_2d', hist)
+                histories[formatted_symbol] = hist
+        return histories
+
+    def fetch_symbols_data(self, symbols: List[str]) -> List[Dict]:
+        """Fetch current data for several symbols with a single batched download"""
+        try:
+            formatted = {symbol: self.format_symbol_for_yahoo(symbol) for symbol in symbols}
+            
+            histories = {}
+            missing = []
+            for formatted_symbol in dict.fromkeys(formatted.values()):
+                hist = self.cache.get(formatted_symbol, '1d_2d', QUOTE_TTL)
+                if hist is None:
+                    missing.append(formatted_symbol)
+                else:
+                    histories[formatted_symbol] = hist
+            if missing:
+                histories.update(self.download_quote_histories(missing))
+            
+            symbol_data = []
+            unnamed = []
+            for symbol, formatted_symbol in formatted.items():
+                hist = histories.get(formatted_symbol)
+                if hist is None or hist.empty:
+                    continue
+                data = self.build_quote(symbol, hist['Close'].to_numpy(dtype=np.float64))
+                # Names only come from the profile cache; unknown ones are fetched in the background
+                info = self.cache.get(formatted_symbol, 'info', PROFILE_TTL)
+                if info is None:
+                    unnamed.append(formatted_symbol)
+                else:
+                    data['name'] = info.get('longName', symbol)
+                symbol_data.append(data)
+            self.queue_profile_lookups(unnamed)
+            return symbol_data
+        except Exception as e:
+            print(f"Error fetching watchlist data: {e}")
+            return []
+
+    def fetch_chart_data(self, symbol: str, timeframe: str, include_indicators: bool = False) -> Optional[Dict]:
+        """Fetch chart data with candlesticks and, optionally, RSI"""
         try:
             formatted_symbol = self.format_symbol_for_yahoo(symbol)
             interval, period = self.get_timeframe_period(timeframe)
             
-            ticker = yf.Ticker(formatted_symbol)
-            hist = ticker.history(period=period, interval=interval)
+            data = self.get_chart_arrays(formatted_symbol, period=period, interval=interval)
             
-            if hist.empty:
+            if data is None:
                 return None
                 
-            candles = []
-            for index, row in hist.iterrows():
-                candles.append({
-                    'timestamp': int(index.timestamp() * 1000),
-                    'open': float(row['Open']),
-                    'high': float(row['High']),
-                    'low': float(row['Low']),
-                    'close': float(row['Close']),
-                    'volume': int(row['Volume'])
-                })
+            # The browser computes indicators itself; API clients can opt in
+            if include_indicators:
+                rsi_values, rsi_ma, rsi_upper_bb, rsi_lower_bb = self.calculate_rsi_indicators(data['c'])
+                data['rsi'] = {
+                    'value': np.round(rsi_values, 2),
+                    'ma': np.round(rsi_ma, 2),
+                    'upperBB': np.round(rsi_upper_bb, 2),
+                    'lowerBB': np.round(rsi_lower_bb, 2)
+                }
             
-            # Calculate RSI data
-            close_prices = [c['close'] for c in candles]
-            rsi_values = self.calculate_rsi(close_prices)
-            rsi_ma = self.calculate_sma(rsi_values, 9)
-            rsi_upper_bb, rsi_lower_bb = self.calculate_bollinger_bands(rsi_values, 20, 2)
+            # Round only the wire format, after indicators used full precision, to shorten the JSON
+            for key in ('o', 'h', 'l', 'c'):
+                data[key] = np.round(data[key], 4)
             
-            rsi_data = []
-            for i, candle in enumerate(candles):
-                rsi_data.append({
-                    'timestamp': candle['timestamp'],
-                    'value': rsi_values[i],
-                    'ma': rsi_ma[i],
-                    'upperBB': rsi_upper_bb[i],
-                    'lowerBB': rsi_lower_bb[i]
-                })
-            
-            return {
-                'candles': candles,
-                'rsi': rsi_data
-            }
+            return data
         except Exception as e:
             print(f"Error fetching chart data for {symbol}: {e}")
             return None
 
+    def fetch_chart_json(self, symbol: str, timeframe: str, include_indicators: bool = False) -> Optional[bytes]:
+        """Fetch chart data already encoded as JSON, served from memory while fresh"""
+        formatted_symbol = self.format_symbol_for_yahoo(symbol)
+        key = (formatted_symbol, timeframe, include_indicators)
+        payload = self.chart_cache.get(key)
+        if payload is None:
+            interval, period = self.get_timeframe_period(timeframe)
+            ttl = ttl_for_interval(interval)
+            # Expire together with the disk entry the data is served from, not a full TTL later.
+            # Reading the fetch time first errs early if a refresh lands in between.
+            started_at = time.time()
+            fetched_at = self.cache.fetched_at(formatted_symbol, f"chart_{interval}_{period}")
+            if fetched_at is None or started_at - fetched_at > ttl:
+                fetched_at = started_at
+            
+            data = self.fetch_chart_data(symbol, timeframe, include_indicators)
+            if data is None:
+                return None
+            payload = orjson.dumps(data, option=OrjsonProvider.option)
+            remaining = fetched_at + ttl - time.time()
+            if remaining > 0:
+                self.chart_cache.set(key, payload, remaining)
+        return payload
+
     def search_symbols(self, query: str) -> List[Dict]:
         """Search for symbols"""
         try:
@@ -197,7 +470,7 @@ class TradingPlatform:
             
             # Try direct symbol lookup
             try:
-                ticker = yf.Ticker(query.upper())
+                ticker = yf.Ticker(query.upper(), session=http_session)
                 info = ticker.info
                 if info and 'symbol' in info:
                     results.append({
@@ -213,7 +486,7 @@ class TradingPlatform:
             # Try with .NS suffix for Indian stocks
             if not results and len(query) <= 10:
                 try:
-                    ticker = yf.Ticker(f"{query.upper()}.NS")
+                    ticker = yf.Ticker(f"{query.upper()}.NS", session=http_session)
                     info = ticker.info
                     if info and 'symbol' in info:
                         results.append({
@@ -250,9 +523,10 @@ def get_symbol_data(symbol):
 @app.route('/api/chart/<symbol>/<timeframe>')
 def get_chart_data(symbol, timeframe):
     """Get chart data"""
-    data = trading_platform.fetch_chart_data(symbol, timeframe)
-    if data:
-        return jsonify(data)
+    include_indicators = request.args.get('indicators') == '1'
+    payload = trading_platform.fetch_chart_json(symbol, timeframe, include_indicators)
+    if payload:
+        return app.response_class(payload, mimetype='application/json')
     return jsonify({'error': 'Chart data not found'}), 404
 
 @app.route('/api/search')
@@ -270,33 +544,45 @@ def get_popular_symbols():
     """Get popular symbols"""
     return jsonify(trading_platform.popular_symbols)
 
+def get_session_watchlists() -> Dict[str, Dict]:
+    """Get the session's watchlists keyed by id, migrating the old list format"""
+    watchlists = session.get('watchlists', {})
+    if isinstance(watchlists, list):
+        watchlists = {w['id']: w for w in watchlists}
+        session['watchlists'] = watchlists
+    return watchlists
+
 @app.route('/api/watchlists', methods=['GET'])
 def get_watchlists():
     """Get user watchlists"""
-    watchlists = session.get('watchlists', [])
-    return jsonify(watchlists)
+    watchlists = list(get_session_watchlists().values())
+    response = jsonify(watchlists)
+    # Always revalidate, letting unchanged watchlists come back as 304 Not Modified
+    response.add_etag()
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 @app.route('/api/watchlists', methods=['POST'])
 def save_watchlists():
     """Save user watchlists"""
-    watchlists = request.json
-    session['watchlists'] = watchlists
+    watchlists = request.get_json(silent=True)
+    if not isinstance(watchlists, list) or not all(
+        isinstance(w, dict) and isinstance(w.get('id'), str) for w in watchlists
+    ):
+        return jsonify({'error': 'Expected a list of watchlists with string ids'}), 400
+    
+    session['watchlists'] = {w['id']: w for w in watchlists}
     return jsonify({'success': True})
 
 @app.route('/api/watchlist/<watchlist_id>/data')
 def get_watchlist_data(watchlist_id):
     """Get watchlist symbol data"""
-    watchlists = session.get('watchlists', [])
-    watchlist = next((w for w in watchlists if w['id'] == watchlist_id), None)
+    watchlist = get_session_watchlists().get(watchlist_id)
     
     if not watchlist:
         return jsonify({'error': 'Watchlist not found'}), 404
     
-    symbol_data = []
-    for symbol in watchlist['symbols']:
-        data = trading_platform.fetch_symbol_data(symbol)
-        if data:
-            symbol_data.append(data)
+    symbol_data = trading_platform.fetch_symbols_data(watchlist['symbols'])
     
     return jsonify({
         'watchlist': watchlist,
@@ -304,4 +590,4 @@ def get_watchlist_data(watchlist_id):
     })
 
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    app.run(debug=True, threaded=True)
\ No newline at end of file
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Compile the fused RSI indicator kernel ahead of time with Numba.
+
+Produces the indicators_aot extension module next to this script, which
+indicators.py imports in preference to the JIT-compiled kernel.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from indicators import _rsi_sma_bb
+
+cc = CC('indicators_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export('rsi_sma_bb', 'UniTuple(float64[:], 4)(float64[:], int64, int64, int64, float64)')(_rsi_sma_bb)
+
+if __name__ == '__main__':
+    cc.compile()
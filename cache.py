@@ -0,0 +1,113 @@
+"""
+Disk and in-memory caches for Yahoo Finance data
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+# Seconds a cached response stays fresh, keyed by Yahoo Finance interval
+INTERVAL_TTL = {
+    '1m': 30,
+    '5m': 30,
+    '15m': 60,
+    '1h': 300,
+    '1d': 86400,
+    '1wk': 86400,
+    '1mo': 86400,
+}
+DEFAULT_TTL = 300
+
+
+def ttl_for_interval(interval: str) -> int:
+    """Get the cache TTL in seconds for a Yahoo Finance interval"""
+    return INTERVAL_TTL.get(interval, DEFAULT_TTL)
+
+
+class FileCache:
+    """Pickle-backed cache with a JSON sidecar recording the fetch time"""
+
+    def __init__(self, root: str = '.cache'):
+        self.root = root
+
+    def _path(self, symbol: str, name: str) -> str:
+        # Hash the symbol so user input can never escape the cache directory
+        key = hashlib.md5(symbol.upper().encode('utf-8')).hexdigest()
+        return os.path.join(self.root, key, name)
+
+    def fetched_at(self, symbol: str, name: str) -> Optional[float]:
+        """Return when the cached value was fetched, or None if nothing is cached"""
+        try:
+            with open(f"{self._path(symbol, name)}.json") as f:
+                return float(json.load(f)['fetched_at'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def get(self, symbol: str, name: str, ttl: int) -> Optional[Any]:
+        """Return the cached value if it is younger than ttl seconds"""
+        path = self._path(symbol, name)
+        try:
+            fetched_at = self.fetched_at(symbol, name)
+            if fetched_at is None or time.time() - fetched_at > ttl:
+                return None
+            with open(f"{path}.pkl", 'rb') as f:
+                return pickle.load(f)
+        except (OSError, ValueError, KeyError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def set(self, symbol: str, name: str, value: Any) -> None:
+        """Store a value along with the current fetch time"""
+        path = self._path(symbol, name)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._write(f"{path}.pkl", pickle.dumps(value))
+            self._write(f"{path}.json", json.dumps({'symbol': symbol, 'fetched_at': time.time()}).encode('utf-8'))
+        except OSError as e:
+            print(f"Error writing cache for {symbol}: {e}")
+
+    def _write(self, path: str, data: bytes) -> None:
+        # Write to a temp file and rename so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache whose entries expire after a TTL"""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value if present and not expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.time() > expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: int) -> None:
+        """Store a value for ttl seconds, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
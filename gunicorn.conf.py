@@ -0,0 +1,14 @@
+"""
+Gunicorn configuration for the Flask Trading Platform
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Threaded workers let many blocking Yahoo Finance calls overlap in each process
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+timeout = 60
@@ -0,0 +1,79 @@
+"""
+Fused RSI indicator kernel for the Flask Trading Platform
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; TradingPlatform falls back to NumPy
+    njit = None
+
+
+def _rsi_sma_bb(close, rsi_period=14, ma_period=9, bb_period=20, mult=2.0):
+    """Compute RSI, SMA(RSI) and Bollinger Bands(RSI) in a single O(N) pass"""
+    n = close.shape[0]
+    rsi = np.empty(n)
+    ma = np.empty(n)
+    upper = np.empty(n)
+    lower = np.empty(n)
+
+    warmup = n < rsi_period + 1
+    avg_gain = 0.0
+    avg_loss = 0.0
+    ma_sum = 0.0
+    bb_sum = 0.0
+    bb_sum_sq = 0.0
+
+    for i in range(n):
+        # Wilder RSI: seed with a simple mean, then apply the running recurrence
+        if i > 0 and not warmup:
+            delta = close[i] - close[i - 1]
+            gain = delta if delta > 0.0 else 0.0
+            loss = -delta if delta < 0.0 else 0.0
+            if i <= rsi_period:
+                avg_gain += gain / rsi_period
+                avg_loss += loss / rsi_period
+            else:
+                avg_gain = (avg_gain * (rsi_period - 1) + gain) / rsi_period
+                avg_loss = (avg_loss * (rsi_period - 1) + loss) / rsi_period
+
+        if warmup or i < rsi_period:
+            value = 50.0
+        elif avg_loss == 0.0:
+            value = 100.0
+        else:
+            value = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        rsi[i] = value
+
+        # SMA over RSI: running sum, the RSI output doubles as the window buffer
+        ma_sum += value
+        if i >= ma_period:
+            ma_sum -= rsi[i - ma_period]
+        ma[i] = ma_sum / ma_period if i >= ma_period - 1 else value
+
+        # Bollinger Bands over RSI: running sum and sum of squares give O(1) std
+        bb_sum += value
+        bb_sum_sq += value * value
+        if i >= bb_period:
+            old = rsi[i - bb_period]
+            bb_sum -= old
+            bb_sum_sq -= old * old
+        if i >= bb_period - 1:
+            mean = bb_sum / bb_period
+            variance = bb_sum_sq / bb_period - mean * mean
+            std_dev = np.sqrt(variance) if variance > 0.0 else 0.0
+            upper[i] = mean + mult * std_dev
+            lower[i] = mean - mult * std_dev
+        else:
+            upper[i] = value + 10
+            lower[i] = value - 10
+
+    return rsi, ma, upper, lower
+
+
+# Prefer the ahead-of-time build (see build_indicators.py) to avoid JIT warm-up
+try:
+    from indicators_aot import rsi_sma_bb
+except ImportError:
+    rsi_sma_bb = njit(cache=True)(_rsi_sma_bb) if njit is not None else None
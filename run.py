@@ -15,5 +15,6 @@ if __name__ == '__main__':
     app.run(
         host='0.0.0.0',
         port=int(os.environ.get('PORT', 5000)),
-        debug=True
+        debug=True,
+        threaded=True
     )
\ No newline at end of file
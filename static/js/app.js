@@ -253,7 +253,7 @@ class TradingApp {
             const response = await fetch(`/api/chart/${this.selectedSymbol}/${this.selectedTimeframe}`);
             const data = await response.json();
             
-            if (data.candles && data.candles.length > 0) {
+            if (data.t && data.t.length > 0) {
                 this.renderChart(data);
             }
         } catch (error) {
@@ -272,9 +272,9 @@ class TradingApp {
         if (this.rsiChart) this.rsiChart.destroy();
         
         // Prepare data
-        const labels = data.candles.map(candle => new Date(candle.timestamp).toLocaleTimeString());
-        const prices = data.candles.map(candle => candle.close);
-        const rsiValues = data.rsi.map(rsi => rsi.value);
+        const labels = data.t.map(timestamp => new Date(timestamp).toLocaleTimeString());
+        const prices = data.c;
+        const { rsi, ma, upperBB, lowerBB } = calculateRSIIndicators(prices);
         
         // Price chart
         this.priceChart = new Chart(ctx, {
@@ -329,12 +329,37 @@ class TradingApp {
                     labels: labels,
                     datasets: [{
                         label: 'RSI',
-                        data: rsiValues,
+                        data: rsi,
                         borderColor: '#3b82f6',
                         backgroundColor: 'rgba(59, 130, 246, 0.1)',
                         borderWidth: 2,
+                        pointRadius: 0,
                         fill: false,
                         tension: 0.1
+                    }, {
+                        label: 'MA',
+                        data: ma,
+                        borderColor: '#f59e0b',
+                        borderWidth: 1.5,
+                        pointRadius: 0,
+                        fill: false,
+                        tension: 0.1
+                    }, {
+                        label: 'Upper BB',
+                        data: upperBB,
+                        borderColor: '#9ca3af',
+                        borderWidth: 1,
+                        borderDash: [4, 4],
+                        pointRadius: 0,
+                        fill: false
+                    }, {
+                        label: 'Lower BB',
+                        data: lowerBB,
+                        borderColor: '#9ca3af',
+                        borderWidth: 1,
+                        borderDash: [4, 4],
+                        pointRadius: 0,
+                        fill: false
                     }]
                 },
                 options: {
@@ -0,0 +1,68 @@
+// RSI with its moving average and Bollinger Bands, computed in a single pass.
+// Mirrors the fused kernel in indicators.py so charts match the server output.
+function calculateRSIIndicators(closes, rsiPeriod = 14, maPeriod = 9, bbPeriod = 20, multiplier = 2) {
+    const n = closes.length;
+    const rsi = new Array(n);
+    const ma = new Array(n);
+    const upperBB = new Array(n);
+    const lowerBB = new Array(n);
+
+    const warmup = n < rsiPeriod + 1;
+    let avgGain = 0;
+    let avgLoss = 0;
+    let maSum = 0;
+    let bbSum = 0;
+    let bbSumSq = 0;
+
+    for (let i = 0; i < n; i++) {
+        // Wilder RSI: seed with a simple mean, then apply the running recurrence
+        if (i > 0 && !warmup) {
+            const delta = closes[i] - closes[i - 1];
+            const gain = delta > 0 ? delta : 0;
+            const loss = delta < 0 ? -delta : 0;
+            if (i <= rsiPeriod) {
+                avgGain += gain / rsiPeriod;
+                avgLoss += loss / rsiPeriod;
+            } else {
+                avgGain = (avgGain * (rsiPeriod - 1) + gain) / rsiPeriod;
+                avgLoss = (avgLoss * (rsiPeriod - 1) + loss) / rsiPeriod;
+            }
+        }
+
+        let value;
+        if (warmup || i < rsiPeriod) {
+            value = 50;
+        } else if (avgLoss === 0) {
+            value = 100;
+        } else {
+            value = 100 - 100 / (1 + avgGain / avgLoss);
+        }
+        rsi[i] = value;
+
+        // SMA over RSI using a running sum
+        maSum += value;
+        if (i >= maPeriod) maSum -= rsi[i - maPeriod];
+        ma[i] = i >= maPeriod - 1 ? maSum / maPeriod : value;
+
+        // Bollinger Bands over RSI using running sum and sum of squares
+        bbSum += value;
+        bbSumSq += value * value;
+        if (i >= bbPeriod) {
+            const old = rsi[i - bbPeriod];
+            bbSum -= old;
+            bbSumSq -= old * old;
+        }
+        if (i >= bbPeriod - 1) {
+            const mean = bbSum / bbPeriod;
+            const variance = bbSumSq / bbPeriod - mean * mean;
+            const stdDev = variance > 0 ? Math.sqrt(variance) : 0;
+            upperBB[i] = mean + multiplier * stdDev;
+            lowerBB[i] = mean - multiplier * stdDev;
+        } else {
+            upperBB[i] = value + 10;
+            lowerBB[i] = value - 10;
+        }
+    }
+
+    return { rsi, ma, upperBB, lowerBB };
+}